@@ -0,0 +1,278 @@
+"""
+Generates synthetic citation corpora for the benchmark suite.
+
+A corpus directory contains:
+
+- `snowball.json`: Snowball JSON with `items` nodes and `items * links_per_item` links.
+- `additional.bib`: BibTeX where half the entries overlap with the Snowball nodes.
+- `links.xlsx`: one sheet per cited paper, with citing paper filenames in the
+  `Paper` column and noisy formatted references in the `Reference` column.
+- `openalex.jsonl`: canned OpenAlex works for every DOI, served by `stub_openalex.py`.
+
+Usage: python benchmarks/generate.py OUTPUT_DIR --items 10000
+"""
+
+import argparse
+import json
+import random
+import unicodedata
+
+from itertools import chain
+from pathlib import Path
+
+import pandas as pd
+
+WORDS = (
+    "adaptive attention augmented citation collaborative computational context "
+    "creative data design digital dynamic embodied evaluation exploring fabrication "
+    "graph human interaction interactive knowledge language learning literature "
+    "mapping mixed model network novel personal physical prototyping reading reality "
+    "research scholarly search semantic sensemaking social spatial study support "
+    "system tangible textual tools understanding user visual visualization workflow"
+).split()
+SURNAMES = (
+    "Smith Zhang Garcia Müller Rossi Kim Tanaka Silva Novak Dubois Ivanova Larsen "
+    "Okafor Nguyen Cohen Kowalski Hansen Moreau Haddad Fischer Bianchi Yamamoto"
+).split()
+VENUES = [
+    ("CHI Conference on Human Factors in Computing Systems", "CHI"),
+    ("ACM Symposium on User Interface Software and Technology", "UIST"),
+    ("Designing Interactive Systems Conference", "DIS"),
+    ("ACM Conference on Computer-Supported Cooperative Work", "CSCW"),
+    ("IEEE Transactions on Visualization and Computer Graphics", None),
+    ("Journal of the Association for Information Science and Technology", None),
+]
+DOMAINS = ["hci", "visualization", "information science", "design"]
+DOI_PREFIX = "10.5555/synth."
+BIBTEX_ACCENTS = {"\u0308": '"', "\u0301": "'", "\u0300": "`", "\u0302": "^", "\u0303": "~"}
+
+
+def doi_of(index: int) -> str:
+    return f"{DOI_PREFIX}{index:08d}"
+
+
+def make_paper(index: int, seed: int) -> dict:
+    # Papers are derived from their index so that corpora can be streamed to disk
+    rng = random.Random(seed * 100_000_003 + index)
+    venue, abbreviation = rng.choice(VENUES)
+    year = rng.randint(1990, 2025)
+    return {
+        "index": index,
+        "doi": doi_of(index),
+        "title": " ".join(rng.choices(WORDS, k=rng.randint(4, 12))).capitalize()
+        + f" {index}",
+        "authors": [
+            f"{rng.choice(SURNAMES)}, {chr(rng.randint(65, 90))}."
+            for _ in range(rng.randint(1, 5))
+        ],
+        "venue": f"{abbreviation} '{year % 100:02d}" if abbreviation else venue,
+        "container": venue,
+        "year": year,
+        "conference": abbreviation is not None,
+    }
+
+
+def bibtex_escape(text: str) -> str:
+    # citeproc-py reads .bib files as ASCII, so write accents as TeX commands
+    escaped = []
+    for char in unicodedata.normalize("NFD", text):
+        if char in BIBTEX_ACCENTS and escaped:
+            escaped[-1] = f"{{\\{BIBTEX_ACCENTS[char]}{escaped[-1]}}}"
+        elif char.isascii():
+            escaped.append(char)
+    return "".join(escaped)
+
+
+def add_noise(text: str, rng: random.Random, rate: float) -> str:
+    chars = list(text)
+    for _ in range(max(1, int(len(chars) * rate))):
+        position = rng.randrange(len(chars))
+        operation = rng.random()
+        if operation < 0.4:
+            del chars[position]
+        elif operation < 0.7 and position + 1 < len(chars):
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        else:
+            chars.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz "))
+    return "".join(chars).replace(".", "")
+
+
+def format_reference(paper: dict, rng: random.Random, noise: float) -> str:
+    authors = paper["authors"]
+    if len(authors) > 3 and rng.random() < 0.5:
+        author_text = f"{authors[0]} et al"
+    else:
+        author_text = ", ".join(authors)
+    title = add_noise(paper["title"], rng, noise)
+    if rng.random() < 0.2:
+        title = title.upper()
+    return f"{author_text.rstrip('.')}. {paper['year']}. {title}. In {paper['container']}."
+
+
+def write_snowball(
+    path: Path, items: int, links_per_item: int, seed: int, rng: random.Random
+):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"nodes": [\n')
+        for index in range(items):
+            paper = make_paper(index, seed)
+            node = {
+                "id": paper["doi"],
+                "title": paper["title"],
+                "abstract": " ".join(rng.choices(WORDS, k=60)),
+                "authors": paper["authors"],
+                "year": paper["year"],
+                "venue": paper["venue"],
+                "domain": rng.choice(DOMAINS),
+                "framing": None,
+                "codes": rng.sample(WORDS, k=3),
+                "globalCitations": rng.randint(0, 5000),
+                "seed": rng.random() < 0.01,
+            }
+            f.write(",\n" if index > 0 else "")
+            f.write(json.dumps(node, ensure_ascii=False))
+        f.write('\n], "links": [\n')
+        for index in range(items):
+            for link in range(links_per_item):
+                target = rng.randrange(items * 11 // 10)
+                # Roughly 10% of links point to items that don't exist
+                target_id = doi_of(target) if target < items else doi_of(10**8 + target)
+                f.write(",\n" if index > 0 or link > 0 else "")
+                f.write(json.dumps({"source": doi_of(index), "target": target_id}))
+        f.write("\n]}\n")
+
+
+def write_bibtex(path: Path, items: int, seed: int):
+    with open(path, "w", encoding="utf-8") as f:
+        # Half of the Snowball items, plus 10% new items
+        for index in chain(range(items // 2), range(items, items + items // 10)):
+            paper = make_paper(index, seed)
+            entry_type = "inproceedings" if paper["conference"] else "article"
+            container = "booktitle" if paper["conference"] else "journal"
+            authors = bibtex_escape(" and ".join(paper["authors"]))
+            f.write(
+                f"@{entry_type}{{synth{paper['index']},\n"
+                f"  title = {{{paper['title']}}},\n"
+                f"  author = {{{authors}}},\n"
+                f"  {container} = {{{paper['container']}}},\n"
+                f"  year = {{{paper['year']}}},\n"
+                f"  doi = {{{paper['doi']}}},\n"
+                f"}}\n\n"
+            )
+
+
+def write_excel(
+    path: Path,
+    items: int,
+    seed: int,
+    sheets: int,
+    citers_per_sheet: int,
+    noise: float,
+    rng: random.Random,
+):
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame({"About": ["Synthetic citation list"]}).to_excel(
+            writer, sheet_name="Info", index=False
+        )
+        for cited_index in rng.sample(range(items), k=min(sheets, items)):
+            cited = make_paper(cited_index, seed)
+            citers = [
+                make_paper(index, seed)
+                for index in rng.sample(range(items), k=min(citers_per_sheet, items))
+            ]
+            pd.DataFrame(
+                {
+                    "Paper": [
+                        f"{citer['year']} - {add_noise(citer['title'], rng, noise / 2)}.pdf"
+                        for citer in citers
+                    ],
+                    "Reference": [
+                        format_reference(cited, rng, noise) for _ in citers
+                    ],
+                }
+            ).to_excel(writer, sheet_name=f"Sheet {cited['index']}", index=False)
+
+
+def openalex_work(paper: dict, rng: random.Random) -> dict:
+    return {
+        "id": f"https://openalex.org/W{paper['index'] + 1000000000}",
+        "doi": f"https://doi.org/{paper['doi']}",
+        "ids": {"doi": f"https://doi.org/{paper['doi']}"},
+        "type": "proceedings-article" if paper["conference"] else "journal-article",
+        "title": paper["title"],
+        "display_name": paper["title"],
+        "publication_year": paper["year"],
+        "publication_date": f"{paper['year']}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "authorships": [
+            {"author_position": "middle", "author": {"display_name": author}}
+            for author in paper["authors"]
+        ],
+        "host_venue": {"display_name": paper["container"], "url": None},
+        "primary_location": {
+            "source": {"display_name": paper["container"], "homepage_url": None}
+        },
+        "biblio": {
+            "volume": str(rng.randint(1, 40)),
+            "issue": str(rng.randint(1, 12)),
+            "first_page": str(rng.randint(1, 500)),
+            "last_page": str(rng.randint(501, 900)),
+        },
+        "cited_by_count": rng.randint(0, 5000),
+        "referenced_works": [
+            f"https://openalex.org/W{rng.randint(1000000000, 1005000000)}"
+            for _ in range(rng.randint(5, 40))
+        ],
+        "abstract_inverted_index": {word: [i] for i, word in enumerate(rng.sample(WORDS, k=30))},
+        "concepts": [
+            {"display_name": word, "score": rng.random()} for word in rng.sample(WORDS, k=8)
+        ],
+    }
+
+
+def write_openalex(path: Path, items: int, seed: int, rng: random.Random):
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(items + items // 10):
+            paper = make_paper(index, seed)
+            f.write(json.dumps(openalex_work(paper, rng), ensure_ascii=False))
+            f.write("\n")
+
+
+def generate_corpus(
+    output: str,
+    items: int = 10_000,
+    links_per_item: int = 10,
+    sheets: int = 50,
+    citers_per_sheet: int = 20,
+    noise: float = 0.05,
+    seed: int = 0,
+) -> Path:
+    rng = random.Random(seed)
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    write_snowball(output / "snowball.json", items, links_per_item, seed, rng)
+    write_bibtex(output / "additional.bib", items, seed)
+    write_excel(output / "links.xlsx", items, seed, sheets, citers_per_sheet, noise, rng)
+    write_openalex(output / "openalex.jsonl", items, seed, rng)
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--links-per-item", type=int, default=10)
+    parser.add_argument("--sheets", type=int, default=50)
+    parser.add_argument("--citers-per-sheet", type=int, default=20)
+    parser.add_argument("--noise", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_corpus(
+        args.output,
+        items=args.items,
+        links_per_item=args.links_per_item,
+        sheets=args.sheets,
+        citers_per_sheet=args.citers_per_sheet,
+        noise=args.noise,
+        seed=args.seed,
+    )
@@ -0,0 +1,228 @@
+"""
+Benchmarks the bibliomorph pipeline on a synthetic corpus.
+
+Every scenario runs in a fresh process so that its peak RSS is not inflated by
+the scenarios before it. Per-stage timings come from `PipelineProfiler`.
+
+Usage: python benchmarks/run.py --items 10000 --output bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import re
+import sys
+import traceback
+
+from pathlib import Path
+
+from bibliomorph.formatters.mapping import MappingJSONFormatter
+from bibliomorph.graph import CitationGraph
+from bibliomorph.loaders.bibtex import BibTexLoader
+from bibliomorph.loaders.excel_links import ExcelLinksLoader
+from bibliomorph.loaders.snowball import SnowballLoader
+from bibliomorph.matchers.text import TextSimilarityMatcher
+from bibliomorph.processors.openalex import OpenAlexEnricher
+from bibliomorph.profiling import PipelineProfiler
+from bibliomorph.utils.normalization import Normalizer
+from bibliomorph.utils.string import count_strings
+
+from generate import generate_corpus
+from stub_openalex import redirect_pyalex, start_server
+
+
+SCENARIOS = ["construct", "merge", "merge_matchers", "enrich", "export"]
+
+# Shared like in example.py, so each distinct title is cleaned once per scenario
+title_normalizer = Normalizer(["clean", "whitespace"])
+venue_normalizer = Normalizer(["abbreviation"])
+
+
+def format_source(strings: list[str]) -> list[str]:
+    titles = []
+    for string in strings:
+        found = re.findall(r"\d\d\d\d\s*-\s*(.+)\.pdf", string)
+        if len(found) > 0:
+            titles.append(title_normalizer.normalize(found[0]))
+    return titles
+
+
+def format_target(strings: list[str]) -> list[str]:
+    titles = []
+    for string in strings:
+        found = re.findall(r"\d\d\d\d\s*\.\s*([^.]+)\.", string)
+        if len(found) > 0:
+            titles.append(title_normalizer.normalize(found[0]))
+    counts = count_strings(titles)
+    title = counts[0][0]
+    return [title] * len(strings)
+
+
+def excel_loader():
+    return ExcelLinksLoader(
+        source="Paper",
+        target="Reference",
+        source_formatter=format_source,
+        target_formatter=format_target,
+        skip_sheets=["Info"],
+    )
+
+
+def title_matcher(threshold: float):
+    return TextSimilarityMatcher(
+        threshold=threshold,
+        domain_id=lambda x: x,
+        domain_value=lambda x: x,
+        range_id=lambda node: node["id"],
+        range_value=lambda node: node["csl"]["title"],
+        normalizer=title_normalizer,
+    )
+
+
+def mapping_formatter():
+    return MappingJSONFormatter(
+        items_field="nodes",
+        links_field="links",
+        mapping={
+            "id": ["id"],
+            "title": ["snowball/title", "csl/title"],
+            "authors": ["snowball/authors", "csl/author"],
+            "year": ["snowball/year", "csl/issued/year"],
+            "venue": ["snowball/venue", "csl/container_title"],
+            "globalCitations": ["snowball/globalCitations", "openalex/cited_by_count"],
+            "localCitations": lambda graph, item_id: len(graph.in_edges(item_id)),
+        },
+        defaults={"title": "", "authors": [], "year": -1},
+        postprocess={
+            "title": lambda title, _: str(title),
+            "venue": venue_normalizer,
+        },
+    )
+
+
+def run_scenario(scenario: str, corpus: str, openalex_url: str | None, profile: bool):
+    # Exceptions from libraries may not survive pickling back to the parent,
+    # which would leave the pool waiting forever, so return them as text.
+    try:
+        return execute_scenario(scenario, Path(corpus), openalex_url, profile)
+    except Exception:
+        return {"error": traceback.format_exc()}
+
+
+def execute_scenario(scenario: str, corpus: Path, openalex_url: str | None, profile: bool):
+    profiler = PipelineProfiler(profile=profile)
+    graph = CitationGraph(corpus / "snowball.json", SnowballLoader(), profiler=profiler)
+
+    if scenario == "merge":
+        graph.merge(corpus / "additional.bib", BibTexLoader())
+    elif scenario == "merge_matchers":
+        graph.merge(
+            corpus / "links.xlsx",
+            excel_loader(),
+            source_matcher=title_matcher(18),
+            target_matcher=title_matcher(37),
+        )
+    elif scenario == "enrich":
+        redirect_pyalex(openalex_url)
+        graph.run(OpenAlexEnricher())
+    elif scenario == "export":
+        graph.write(corpus / "output.json", mapping_formatter())
+
+    return profiler.report()
+
+
+def summarize(scenario: str, report: dict) -> list[dict]:
+    rows = []
+    for stage in report["stages"]:
+        counts = stage["counts"]
+        items = counts.get("items", counts.get("pairs", 0))
+        rows.append(
+            {
+                "scenario": scenario,
+                "stage": stage["stage"],
+                "wall_time": stage["wall_time"],
+                "cpu_time": stage["cpu_time"],
+                "items": items,
+                "throughput": items / stage["wall_time"] if stage["wall_time"] > 0 else None,
+                "peak_rss": stage["peak_rss"],
+            }
+        )
+    return rows
+
+
+def print_table(rows: list[dict]):
+    print(
+        f"{'scenario':<16}{'stage':<28}{'wall (s)':>10}{'cpu (s)':>10}"
+        f"{'items':>12}{'items/s':>14}{'peak RSS (MiB)':>16}"
+    )
+    for row in rows:
+        throughput = f"{row['throughput']:.0f}" if row["throughput"] else "-"
+        rss = f"{row['peak_rss'] / 2**20:.1f}" if row["peak_rss"] else "-"
+        print(
+            f"{row['scenario']:<16}{row['stage']:<28}{row['wall_time']:>10.3f}"
+            f"{row['cpu_time']:>10.3f}{row['items']:>12}{throughput:>14}{rss:>16}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default="benchmarks/corpus")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--links-per-item", type=int, default=10)
+    parser.add_argument("--sheets", type=int, default=50)
+    parser.add_argument("--citers-per-sheet", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--profile", action="store_true", help="Run cProfile on every stage.")
+    parser.add_argument("--output", help="Write the full JSON report to this path.")
+    args = parser.parse_args()
+
+    corpus = Path(args.corpus) / f"{args.items}-{args.seed}"
+    if args.regenerate or not (corpus / "openalex.jsonl").exists():
+        print(f"Generating corpus with {args.items} items in '{corpus}'...", file=sys.stderr)
+        generate_corpus(
+            corpus,
+            items=args.items,
+            links_per_item=args.links_per_item,
+            sheets=args.sheets,
+            citers_per_sheet=args.citers_per_sheet,
+            seed=args.seed,
+        )
+
+    server = None
+    openalex_url = None
+    if "enrich" in args.scenarios:
+        server = start_server(corpus / "openalex.jsonl")
+        openalex_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+    reports = {}
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for scenario in args.scenarios:
+            reports[scenario] = pool.apply(
+                run_scenario, (scenario, str(corpus), openalex_url, args.profile)
+            )
+
+    if server is not None:
+        server.shutdown()
+
+    for scenario, report in reports.items():
+        if "error" in report:
+            print(f"Scenario '{scenario}' failed:\n{report['error']}", file=sys.stderr)
+    rows = [
+        row
+        for scenario, report in reports.items()
+        if "error" not in report
+        for row in summarize(scenario, report)
+    ]
+    print_table(rows)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"corpus": str(corpus), "scenarios": reports}, f, indent=4)
+    if any("error" in report for report in reports.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
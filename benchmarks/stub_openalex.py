@@ -0,0 +1,90 @@
+"""
+A local stand-in for the OpenAlex API, serving works from a canned `openalex.jsonl`.
+
+Only `GET /works?filter=doi:...|...` is implemented, which is what
+`OpenAlexEnricher` uses. Like the real API, results are paged (25 per page by
+default, see `per-page` and `page`) and come back in an order unrelated to
+the order of the requested DOIs.
+"""
+
+import json
+import threading
+
+from hashlib import blake2b
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+def normalize_doi(doi: str) -> str:
+    return doi.lower().replace("https://doi.org/", "").replace("http://doi.org/", "")
+
+
+def load_store(path: Path) -> dict[str, bytes]:
+    # Keep the works serialized; the stub only has to splice them into a response
+    store = {}
+    with open(path, "rb") as f:
+        for line in f:
+            work = json.loads(line)
+            store[normalize_doi(work["doi"])] = line.rstrip(b"\n")
+    return store
+
+
+def make_handler(store: dict[str, bytes]):
+    class OpenAlexHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path != "/works" or "filter" not in query:
+                self.send_error(404)
+                return
+
+            dois = []
+            for condition in query["filter"][0].split(","):
+                key, _, values = condition.partition(":")
+                if key == "doi":
+                    dois.extend(normalize_doi(unquote(value)) for value in values.split("|"))
+            found = sorted(
+                (doi for doi in set(dois) if doi in store),
+                key=lambda doi: blake2b(doi.encode("utf-8"), digest_size=8).digest(),
+            )
+            per_page = int(query.get("per-page", ["25"])[0])
+            page = int(query.get("page", ["1"])[0])
+            works = [store[doi] for doi in found[(page - 1) * per_page : page * per_page]]
+
+            meta = {"count": len(found), "db_response_time_ms": 0, "page": page, "per_page": per_page}
+            body = b'{"meta": %s, "results": [%s]}' % (
+                json.dumps(meta).encode("utf-8"),
+                b",".join(works),
+            )
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return OpenAlexHandler
+
+
+def start_server(store_path: str, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(load_store(Path(store_path))))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def redirect_pyalex(base_url: str):
+    # pyalex builds request URLs against api.openalex.org regardless of
+    # `config.openalex_url`, so rewrite them before they are sent.
+    from pyalex.api import BaseOpenAlex
+
+    get_from_url = BaseOpenAlex._get_from_url
+
+    def _get_from_url(self, url, session=None):
+        url = url.replace("https://api.openalex.org", base_url.rstrip("/"), 1)
+        return get_from_url(self, url, session)
+
+    BaseOpenAlex._get_from_url = _get_from_url
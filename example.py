@@ -1,16 +1,18 @@
 import re
 
-from cleantext import clean
-
 from bibliomorph.formatters.mapping import MappingJSONFormatter
 from bibliomorph.graph import CitationGraph
 from bibliomorph.loaders.snowball import SnowballLoader
 from bibliomorph.loaders.bibtex import BibTexLoader
 from bibliomorph.loaders.excel_links import ExcelLinksLoader
 from bibliomorph.matchers.text import TextSimilarityMatcher
-from bibliomorph.processors.openalex import OpenAlexEnricher
+from bibliomorph.processors.openalex import OpenAlexCSLConverter, OpenAlexEnricher
 from bibliomorph.utils.string import count_strings
-from bibliomorph.utils.formatting import venue_abbreviation
+from bibliomorph.utils.normalization import Normalizer
+
+# Shared by the formatters and matchers so each distinct string is cleaned once
+title_normalizer = Normalizer(["clean", "whitespace"])
+venue_normalizer = Normalizer(["abbreviation"])
 
 
 def format_source(strings: list[str]) -> list[str]:
@@ -18,7 +20,7 @@ def format_source(strings: list[str]) -> list[str]:
     for string in strings:
         found = re.findall(r"\d\d\d\d\s*-\s*(.+)\.pdf", string)
         if len(found) > 0:
-            titles.append(clean(found[0]).strip())
+            titles.append(title_normalizer.normalize(found[0]))
     return titles
 
 
@@ -27,7 +29,7 @@ def format_target(strings: list[str]) -> list[str]:
     for string in strings:
         found = re.findall(r"\d\d\d\d\s*\.\s*([^.]+)\.", string)
         if len(found) > 0:
-            titles.append(clean(found[0]).strip())
+            titles.append(title_normalizer.normalize(found[0]))
     counts = count_strings(titles)
     title = counts[0][0]
     return [title] * len(strings)
@@ -37,9 +39,9 @@ def format_venue(venue, item):
     if "csl" not in item:
         print(item)
     if "snowball" in item and item["snowball"]["venue"] is not None:
-        return venue_abbreviation(str(venue))
+        return venue_normalizer.normalize(venue)
     elif "type" in item["csl"] and item["csl"]["type"] == "paper-conference":
-        return venue_abbreviation(str(venue))
+        return venue_normalizer.normalize(venue)
     return None
 
 
@@ -66,17 +68,20 @@ graph = (
             domain_id=lambda x: x,
             domain_value=lambda x: x,
             range_id=lambda node: node["id"],
-            range_value=lambda node: clean(node["csl"]["title"]),
+            range_value=lambda node: node["csl"]["title"],
+            normalizer=title_normalizer,
         ),
         target_matcher=TextSimilarityMatcher(
             threshold=37,
             domain_id=lambda x: x,
             domain_value=lambda x: x,
             range_id=lambda node: node["id"],
-            range_value=lambda node: clean(node["csl"]["title"]),
+            range_value=lambda node: node["csl"]["title"],
+            normalizer=title_normalizer,
         ),
     )
     .run(processor=OpenAlexEnricher())
+    .run(processor=OpenAlexCSLConverter(payload="compact"))
     .write(
         path="output.json",
         formatter=MappingJSONFormatter(
@@ -8,37 +8,53 @@ from .loaders.loader import BaseLoader
 from .matchers.matcher import BaseMatcher
 from .formatters.formatter import BaseFormatter
 from .processors.processor import BaseProcessor
+from .profiling import PipelineProfiler
+from .report import MergeReport
 
 
 class CitationGraph:
 
-    def __init__(self, path: str, loader: BaseLoader):
+    def __init__(
+        self,
+        path: str,
+        loader: BaseLoader,
+        profiler: PipelineProfiler | None = None,
+        report: MergeReport | None = None,
+    ):
         self.path = Path(path)
         self.loader = loader
+        self.profiler = profiler if profiler is not None else PipelineProfiler()
+        self.report = report if report is not None else MergeReport()
         if not self.path.exists():
             raise FileNotFoundError(
                 f"'{path}' does not exist! Please check if you've provided the correct path."
             )
-        items, links = loader.load(self.path)
-        self.graph = nx.DiGraph()
-        self.graph.add_nodes_from([(item["id"], item) for item in items])
+        with self.profiler.stage("load", path=str(self.path)) as counts:
+            items, links = loader.load(self.path)
+            counts["items"] = len(items)
+            counts["links"] = len(links)
 
-        missing = []
-        for link in links:
-            if link["source"] not in self.graph or link["target"] not in self.graph:
-                missing.append((link["source"], link["target"]))
-                continue
-            self.graph.add_edge(link["source"], link["target"])
+        self.report.begin(str(self.path))
+        with self.profiler.stage("build") as counts:
+            self.graph = nx.DiGraph()
+            self.graph.add_nodes_from([(item["id"], item) for item in items])
+
+            missing = 0
+            for link in links:
+                if link["source"] not in self.graph or link["target"] not in self.graph:
+                    self.report.add("missing", link["source"], link["target"])
+                    missing += 1
+                    continue
+                self.graph.add_edge(link["source"], link["target"])
+
+            counts["items"] = self.graph.number_of_nodes()
+            counts["links"] = self.graph.number_of_edges()
+            counts["missing"] = missing
 
         logger.success(
             f"Loaded {self.graph.number_of_nodes()} items and {self.graph.number_of_edges()} links from '{self.path}'."
         )
-
-        if len(missing) > 0:
-            logger.warning("The following links have item IDs that doesn't exist:")
-            for source, target in missing:
-                logger.warning(f"  - {source} -> {target}")
-            logger.warning("They have been skipped.")
+        self.report.log()
 
     def merge(
         self,
@@ -54,7 +70,10 @@ class CitationGraph:
             raise FileNotFoundError(
                 f"'{path}' does not exist! Please check if you've provided the correct path."
             )
-        items, links = loader.load(self.path)
+        with self.profiler.stage("merge.load", path=str(self.path)) as counts:
+            items, links = loader.load(self.path)
+            counts["items"] = len(items)
+            counts["links"] = len(links)
 
         logger.success(
             f"Loaded {len(items)} items and {len(links)} links from '{self.path}'."
@@ -64,76 +83,91 @@ class CitationGraph:
             "items": {"added": 0, "updated": 0},
             "links": {"added": 0},
         }
-        for item in items:
-            if item["id"] in self.graph:
-                out = dpath.merge(item, self.graph.nodes[item["id"]])
-                self.graph.nodes[item["id"]].update(out)
-                statistics["items"]["updated"] += 1
-            else:
-                self.graph.add_nodes_from([(item["id"], dict(item))])
-                statistics["items"]["added"] += 1
+        with self.profiler.stage("merge.items") as counts:
+            for item in items:
+                if item["id"] in self.graph:
+                    out = dpath.merge(item, self.graph.nodes[item["id"]])
+                    self.graph.nodes[item["id"]].update(out)
+                    statistics["items"]["updated"] += 1
+                else:
+                    self.graph.add_nodes_from([(item["id"], dict(item))])
+                    statistics["items"]["added"] += 1
+            counts.update(statistics["items"])
 
         unmatched = set()
         if source_matcher is not None:
-            matches = source_matcher.match(
-                list(set([link["source"] for link in links])),
-                [data for _, data in self.graph.nodes.data()],
-            )
-            for link in links:
-                if link["source"] not in matches:
-                    unmatched.add((link["source"], link["target"]))
-                    continue
-                source_id, source_value, cost = matches[link["source"]]
-                link["source"] = source_id
+            with self.profiler.stage("merge.match_sources") as counts:
+                matches = source_matcher.match(
+                    list(set([link["source"] for link in links])),
+                    [data for _, data in self.graph.nodes.data()],
+                )
+                for link in links:
+                    if link["source"] not in matches:
+                        unmatched.add((link["source"], link["target"]))
+                        continue
+                    source_id, source_value, cost = matches[link["source"]]
+                    link["source"] = source_id
+                counts.update(getattr(source_matcher, "statistics", {}))
 
         if target_matcher is not None:
-            matches = target_matcher.match(
-                list(set([link["target"] for link in links])),
-                [data for _, data in self.graph.nodes.data()],
-            )
+            with self.profiler.stage("merge.match_targets") as counts:
+                matches = target_matcher.match(
+                    list(set([link["target"] for link in links])),
+                    [data for _, data in self.graph.nodes.data()],
+                )
+                for link in links:
+                    if link["target"] not in matches:
+                        unmatched.add((link["source"], link["target"]))
+                        continue
+                    target_id, target_value, cost = matches[link["target"]]
+                    link["target"] = target_id
+                counts.update(getattr(target_matcher, "statistics", {}))
+
+        self.report.begin(str(self.path))
+        for source, target in unmatched:
+            self.report.add("unmatched", source, target)
+
+        with self.profiler.stage("merge.links") as counts:
+            missing = 0
             for link in links:
-                if link["target"] not in matches:
-                    unmatched.add((link["source"], link["target"]))
+                if (link["source"], link["target"]) in unmatched:
                     continue
-                target_id, target_value, cost = matches[link["target"]]
-                link["target"] = target_id
-
-        if len(unmatched) > 0:
-            logger.warning(
-                "The following links did not have a good match and will be skipped:"
-            )
-            for source, target in unmatched:
-                logger.warning(f" - {source} -> {target}")
-
-        for link in links:
-            if (link["source"], link["target"]) in unmatched:
-                continue
-            if link["source"] not in self.graph.nodes:
-                logger.warning(
-                    f"Item '{link['source']}' does not exist! Skipping adding edge {link['source']} -> {link['target']}"
-                )
-                continue
-            if link["target"] not in self.graph.nodes:
-                logger.error(
-                    f"Item '{link['target']}' does not exist! Skipping adding edge {link['source']} -> {link['target']}"
-                )
-                continue
-            self.graph.add_edge(link["source"], link["target"])
-            statistics["links"]["added"] += 1
+                if link["source"] not in self.graph.nodes:
+                    self.report.add("missing_source", link["source"], link["target"])
+                    missing += 1
+                    continue
+                if link["target"] not in self.graph.nodes:
+                    self.report.add("missing_target", link["source"], link["target"])
+                    missing += 1
+                    continue
+                self.graph.add_edge(link["source"], link["target"])
+                statistics["links"]["added"] += 1
+            counts["added"] = statistics["links"]["added"]
+            counts["unmatched"] = len(unmatched)
+            counts["missing"] = missing
 
         logger.success(
             f"Added {statistics['items']['added']} items and {statistics['links']['added']} links. Updated {statistics['items']['updated']} existing items."
         )
+        self.report.log()
 
         return self
 
     def write(self, path: str, formatter: BaseFormatter):
-        formatted = formatter.format(self.graph)
-        with open(path, "wb") as f:
-            f.write(formatted)
+        with self.profiler.stage("write.format") as counts:
+            formatted = formatter.format(self.graph)
+            counts["items"] = self.graph.number_of_nodes()
+            counts["links"] = self.graph.number_of_edges()
+            counts["bytes"] = len(formatted)
+        with self.profiler.stage("write.save", path=str(path)):
+            with open(path, "wb") as f:
+                f.write(formatted)
         logger.success(f"Written to {path}.")
         return self
 
     def run(self, processor: BaseProcessor):
-        processor.run(self.graph)
+        with self.profiler.stage(f"run.{type(processor).__name__}") as counts:
+            processor.run(self.graph)
+            counts["items"] = self.graph.number_of_nodes()
+            counts.update(getattr(processor, "statistics", {}))
         return self
@@ -8,8 +8,10 @@ class BaseMatcher(ABC):
     domain_value: Callable[[Any], str]
     range_id: Callable[[Any], str]
     range_value: Callable[[Any], str]
+    statistics: dict[str, Any]
 
     def __init__(self, **kwargs):
+        self.statistics = {}
         for key, value in kwargs.items():
             setattr(self, key, value)
 
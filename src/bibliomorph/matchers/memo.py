@@ -0,0 +1,110 @@
+import sqlite3
+
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+
+
+def normalize_key(value: str) -> str:
+    return " ".join(str(value).casefold().split())
+
+
+def fingerprint(value: str) -> str:
+    return blake2b(str(value).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class MatchMemo:
+    """
+    Remembers which range item each domain string was matched to.
+
+    Entries are kept in an in-process LRU of at most `max_entries` items and,
+    if `path` is given, in an SQLite file so they survive across runs. Each
+    entry stores the matched range ID and a fingerprint of its value, so that
+    matchers can drop entries whose item disappeared or whose value changed.
+    Use a different `namespace` for each matcher that shares the same file.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        namespace: str = "default",
+        max_entries: int = 100_000,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
+        self.pending_writes: dict[str, tuple[str, str, float]] = {}
+        self.pending_deletes: set[str] = set()
+
+        self.connection = None
+        if self.path is not None:
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                "namespace TEXT, key TEXT, range_id TEXT, fingerprint TEXT, cost REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+
+    def remember(self, key: str, entry: tuple[str, str, float]):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, value: str) -> tuple[str, str, float] | None:
+        key = normalize_key(value)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if key in self.pending_writes:
+            return self.pending_writes[key]
+        if self.connection is None or key in self.pending_deletes:
+            return None
+        row = self.connection.execute(
+            "SELECT range_id, fingerprint, cost FROM matches WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        self.remember(key, row)
+        return row
+
+    def put(self, value: str, range_id: str, range_value: str, cost: float):
+        key = normalize_key(value)
+        entry = (range_id, fingerprint(range_value), cost)
+        self.remember(key, entry)
+        self.pending_deletes.discard(key)
+        if self.connection is not None:
+            self.pending_writes[key] = entry
+
+    def discard(self, value: str):
+        key = normalize_key(value)
+        self.entries.pop(key, None)
+        self.pending_writes.pop(key, None)
+        if self.connection is not None:
+            self.pending_deletes.add(key)
+
+    def flush(self):
+        if self.connection is None:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM matches WHERE namespace = ? AND key = ?",
+                [(self.namespace, key) for key in self.pending_deletes],
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.namespace, key, range_id, range_fingerprint, cost)
+                    for key, (range_id, range_fingerprint, cost) in self.pending_writes.items()
+                ],
+            )
+        self.pending_writes = {}
+        self.pending_deletes = set()
+
+    def close(self):
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
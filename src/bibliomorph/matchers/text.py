@@ -4,42 +4,103 @@ from rapidfuzz import fuzz
 from scipy.optimize import linear_sum_assignment
 
 from .matcher import BaseMatcher
+from .memo import MatchMemo, fingerprint
+from ..utils.normalization import Normalizer
 
 
 class TextSimilarityMatcher(BaseMatcher):
 
     threshold: float = 1
+    memo: MatchMemo | None = None
+    normalizer: Normalizer | None = None
 
     def match(self, domains, ranges):
         domain_ids = [self.domain_id(item) for item in domains]
         range_ids = [self.range_id(item) for item in ranges]
         domain_values = [self.domain_value(item) for item in domains]
         range_values = [self.range_value(item) for item in ranges]
+        if self.normalizer is not None:
+            domain_values = [
+                value or "" for value in self.normalizer.normalize_batch(domain_values)
+            ]
+            range_values = [
+                value or "" for value in self.normalizer.normalize_batch(range_values)
+            ]
+
+        final_matches = {}
+        pending = list(range(len(domain_values)))
+        available = list(range(len(range_values)))
+
+        # Reuse remembered matches whose item still exists with the same value
+        if self.memo is not None:
+            range_indices = {range_id: index for index, range_id in enumerate(range_ids)}
+            claimed = set()
+            pending = []
+            for index, domain_value in enumerate(domain_values):
+                entry = self.memo.get(domain_value)
+                if entry is not None:
+                    range_id, range_fingerprint, cost = entry
+                    range_index = range_indices.get(range_id)
+                    if (
+                        range_index is None
+                        or fingerprint(range_values[range_index]) != range_fingerprint
+                    ):
+                        self.memo.discard(domain_value)
+                    elif range_index not in claimed and cost <= self.threshold:
+                        claimed.add(range_index)
+                        final_matches[domain_ids[index]] = (
+                            range_ids[range_index],
+                            range_values[range_index],
+                            float(cost),
+                        )
+                        continue
+                pending.append(index)
+            available = [index for index in available if index not in claimed]
+        hits = len(final_matches)
 
         costs = []
-        for domain_value in domain_values:
+        for domain_index in pending:
             costs.append([])
-            for range_value in range_values:
-                costs[-1].append(100 - fuzz.ratio(range_value, domain_value))
-        costs = np.array(costs)
+            for range_index in available:
+                costs[-1].append(
+                    100 - fuzz.ratio(range_values[range_index], domain_values[domain_index])
+                )
+        costs = np.array(costs).reshape(len(pending), len(available))
 
         # Run Hungarian algorithm to find best overall match
-        _, col_ind = linear_sum_assignment(costs)
+        row_ind, col_ind = linear_sum_assignment(costs)
 
-        final_matches = {}
-        for index, domain_value in enumerate(domain_values):
-            range_index = col_ind[index]
-            cost = costs[index, col_ind[index]]
+        for row, col in zip(row_ind, col_ind):
+            cost = costs[row, col]
             if cost > self.threshold:
-                logger.debug(
-                    f"Couldn't find a good match for '{domain_value}'. Skipping."
-                )
-                print(range_values[range_index])
-                print(cost)
-            else:
-                final_matches[domain_ids[index]] = (
+                continue
+            domain_index, range_index = pending[row], available[col]
+            final_matches[domain_ids[domain_index]] = (
+                range_ids[range_index],
+                range_values[range_index],
+                float(cost),
+            )
+            if self.memo is not None:
+                self.memo.put(
+                    domain_values[domain_index],
                     range_ids[range_index],
                     range_values[range_index],
                     float(cost),
                 )
+
+        if self.memo is not None:
+            self.memo.flush()
+
+        if len(final_matches) < len(domain_values):
+            logger.debug(
+                f"Couldn't find a good match for {len(domain_values) - len(final_matches)} of {len(domain_values)} values."
+            )
+
+        self.statistics = {
+            "domains": len(domain_values),
+            "ranges": len(range_values),
+            "pairs": len(pending) * len(available),
+            "matched": len(final_matches),
+            "memo_hits": hits,
+        }
         return final_matches
@@ -1,5 +1,7 @@
 from typing import Any, List
 from math import floor
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
 from loguru import logger
 from networkx import DiGraph
 from pyalex import OpenAlexResponseList, Works
@@ -8,6 +10,15 @@ from more_itertools import chunked
 from .processor import BaseProcessor
 
 
+def normalize_doi(doi: str) -> str:
+    return doi.strip().lower().replace("https://doi.org/", "").replace("http://doi.org/", "")
+
+
+def work_doi(work: dict) -> str | None:
+    doi = work.get("doi") or (work.get("ids") or {}).get("doi")
+    return normalize_doi(doi) if doi else None
+
+
 class OpenAlexEnricher(BaseProcessor):
 
     def run(self, graph: DiGraph):
@@ -37,13 +48,21 @@ class OpenAlexEnricher(BaseProcessor):
             else:
                 skipped.add(item_id)
 
+        # Works are matched back to items by DOI, since OpenAlex returns them
+        # in its own order. Items sharing a DOI all get the same work.
+        items_by_doi = {}
+        for item_id, doi in dois:
+            items_by_doi.setdefault(normalize_doi(doi), []).append(item_id)
+
         logger.debug(
-            f"Querying OpenAlex for {len(dois)} DOIs with a batch size of 100."
+            f"Querying OpenAlex for {len(items_by_doi)} DOIs with a batch size of 100."
         )
-        for batch in chunked(dois, 100):
-            query_ids = [item_id for item_id, _ in batch]
-            query_dois = [doi for _, doi in batch]
-            response = Works().filter_or(doi=query_dois).get()
+        latencies = []
+        found = 0
+        for batch in chunked(items_by_doi, 100):
+            request_start = perf_counter()
+            response = Works().filter_or(doi=batch).get(per_page=100)
+            latencies.append(perf_counter() - request_start)
             if type(response) is tuple:
                 data = response[0]
             elif type(response) is OpenAlexResponseList:
@@ -53,11 +72,23 @@ class OpenAlexEnricher(BaseProcessor):
                     f"The query did not return data correctly. The response is: {response}"
                 )
                 continue
-            for index, work in enumerate(data):
-                item_id = query_ids[index]
-                graph.nodes[item_id]["openalex"] = work
+            for work in data:
+                for item_id in items_by_doi.get(work_doi(work), []):
+                    graph.nodes[item_id]["openalex"] = work
+                    found += 1
 
-            logger.debug(f"Updated {len(batch)} items.")
+            logger.debug(f"Updated items for {len(data)} of {len(batch)} DOIs.")
+
+        self.statistics = {
+            "dois": len(dois),
+            "found": found,
+            "isbns": len(isbns),
+            "titles": len(titles),
+            "skipped": len(skipped),
+            "requests": len(latencies),
+            "request_time": sum(latencies),
+            "request_latency_max": max(latencies, default=0.0),
+        }
 
 
 import datetime
@@ -84,14 +115,13 @@ def openalex_work_to_csl(work: Dict[str, Any]) -> Dict[str, Any]:
 
     # --- Container (journal / venue) ---
     host_venue = work.get("host_venue") or {}
-    container_title = host_venue.get("display_name")
+    source = (work.get("primary_location") or {}).get("source") or {}
+    container_title = host_venue.get("display_name") or source.get("display_name")
 
     # --- IDs ---
     ids = work.get("ids") or {}
     doi = ids.get("doi")
-    url = host_venue.get("url") or work.get("primary_location", {}).get(
-        "source", {}
-    ).get("homepage_url")
+    url = host_venue.get("url") or source.get("homepage_url")
 
     # --- Authors ---
     def person_from_authorship(a: Dict[str, Any]) -> Dict[str, str]:
@@ -167,3 +197,146 @@ def openalex_work_to_csl(work: Dict[str, Any]) -> Dict[str, Any]:
 
     # remove None values
     return {k: v for k, v in csl.items() if v not in (None, [], "", {})}
+
+
+def csl_json_to_fields(csl: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert CSL-JSON keys to the citeproc-py style used by the "csl" field of
+    items, e.g. `container-title` to `container_title` and
+    `issued: {"date-parts": [[2020, 1, 2]]}` to `issued: {"year": 2020, ...}`.
+    """
+    fields: Dict[str, Any] = {}
+    for key, value in csl.items():
+        if key == "issued":
+            parts = (value.get("date-parts") or [[]])[0]
+            value = dict(zip(("year", "month", "day"), parts))
+            if not value:
+                continue
+        fields[key.replace("-", "_")] = value
+    return fields
+
+
+def openalex_work_csl_fields(work: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an OpenAlex Work to the fields read by `openalex_work_to_csl`, so
+    that only those have to be pickled when converting in a process pool.
+    """
+    source = (work.get("primary_location") or {}).get("source") or {}
+    fields = {
+        key: work[key]
+        for key in ("type", "title", "host_venue", "publication_year", "publication_date", "biblio")
+        if key in work
+    }
+    fields["ids"] = {"doi": (work.get("ids") or {}).get("doi")}
+    fields["primary_location"] = {
+        "source": {
+            "display_name": source.get("display_name"),
+            "homepage_url": source.get("homepage_url"),
+        }
+    }
+    fields["authorships"] = [
+        {"author": {"display_name": (a.get("author") or {}).get("display_name")}}
+        for a in work.get("authorships") or []
+    ]
+    return fields
+
+
+def openalex_works_to_csl(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [csl_json_to_fields(openalex_work_to_csl(work)) for work in works]
+
+
+class OpenAlexCSLConverter(BaseProcessor):
+    """
+    Converts the OpenAlex works fetched by OpenAlexEnricher into CSL and fills
+    the empty fields of each item's "csl" field, using the same keys as the
+    loaders (e.g. `container_title`, `issued/year`). Works whose DOI doesn't
+    match one of the item's `identifiers["doi"]` are skipped.
+
+    Works are converted in batches of `batch_size`. By default this happens
+    in-process; with `workers` > 1 (or None for one per CPU) batches are spread
+    across a process pool, in which case the pipeline script must be guarded
+    by `if __name__ == "__main__":`. Only the fields the conversion reads are
+    sent to the pool, but pickling still costs more than the conversion itself,
+    so the pool only pays off if `openalex_work_to_csl` is made more expensive
+    (e.g. with a real name parser). Afterwards the raw "openalex" payload is
+    kept as-is (`payload="keep"`), reduced to `keep_fields` (`"compact"`) or
+    removed (`"drop"`).
+    """
+
+    batch_size: int = 1000
+    workers: int | None = 1
+    payload: str = "keep"
+    keep_fields: List[str] = ["id", "doi", "cited_by_count"]
+
+    def run(self, graph: DiGraph):
+        if self.payload not in ("keep", "compact", "drop"):
+            raise ValueError(
+                f"Unknown payload option '{self.payload}'. Please use 'keep', 'compact' or 'drop'."
+            )
+        if self.workers is not None and self.workers < 1:
+            raise ValueError(
+                f"Invalid number of workers '{self.workers}'. Please use a positive integer or None."
+            )
+
+        item_ids = []
+        works = []
+        mismatched = 0
+        for item_id, item in graph.nodes.data():
+            if item.get("openalex"):
+                # Never fill an item from a work that isn't the same paper
+                dois = (item.get("identifiers") or {}).get("doi") or []
+                if work_doi(item["openalex"]) not in {normalize_doi(str(doi)) for doi in dois}:
+                    mismatched += 1
+                    continue
+                item_ids.append(item_id)
+                works.append(item["openalex"])
+        if mismatched > 0:
+            logger.warning(
+                f"{mismatched} OpenAlex works don't match the DOI of their item and have been skipped."
+            )
+
+        logger.debug(
+            f"Converting {len(works)} OpenAlex works to CSL with a batch size of {self.batch_size}."
+        )
+        batches = list(chunked(works, self.batch_size))
+        if self.workers == 1 or len(batches) <= 1:
+            converted, filled = self.fill(graph, item_ids, map(openalex_works_to_csl, batches))
+        else:
+            batches = [[openalex_work_csl_fields(work) for work in batch] for batch in batches]
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                converted, filled = self.fill(
+                    graph, item_ids, executor.map(openalex_works_to_csl, batches)
+                )
+
+        self.statistics = {
+            "converted": converted,
+            "filled_fields": filled,
+            "mismatched": mismatched,
+            "batches": len(batches),
+        }
+        logger.success(
+            f"Converted {converted} OpenAlex works to CSL and filled {filled} empty fields."
+        )
+
+    def fill(self, graph: DiGraph, item_ids: List[str], batches):
+        converted = 0
+        filled = 0
+        for batch in batches:
+            for csl in batch:
+                item = graph.nodes[item_ids[converted]]
+                converted += 1
+                existing = item.setdefault("csl", {})
+                for key, value in csl.items():
+                    if existing.get(key) in (None, [], "", {}):
+                        existing[key] = value
+                        filled += 1
+
+                if self.payload == "drop":
+                    del item["openalex"]
+                elif self.payload == "compact":
+                    item["openalex"] = {
+                        key: item["openalex"][key]
+                        for key in self.keep_fields
+                        if key in item["openalex"]
+                    }
+        return converted, filled
@@ -5,6 +5,7 @@ from networkx import DiGraph
 class BaseProcessor(ABC):
 
     def __init__(self, **kwargs):
+        self.statistics = {}
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -0,0 +1,125 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any, Callable, Iterable
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def process_peak_rss() -> int | None:
+    """Lifetime peak resident set size of the current process in bytes, if available."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def current_rss() -> int | None:
+    """Current resident set size of the current process in bytes, if available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def stage_peak_rss(
+    start: int | None, end: int | None, peak_before: int | None, peak_after: int | None
+) -> int | None:
+    # If the stage raised the process high-water mark, that is its exact peak.
+    # Otherwise the best we know is the larger of the RSS at its start and end.
+    if peak_before is not None and peak_after is not None and peak_after > peak_before:
+        return peak_after
+    samples = [value for value in (start, end) if value is not None]
+    return max(samples) if samples else None
+
+
+class PipelineProfiler:
+    """
+    Collects per-stage timings and counts for a CitationGraph pipeline.
+
+    `profile` is either a bool (profile every stage with cProfile), a stage
+    name or an iterable of stage names to profile. Every hook is called with
+    the stage record once the stage finishes. Stages yield a dict for their
+    numeric counts; the file a stage reads or writes is recorded as `path`.
+
+    `peak_rss` is the stage's own peak when the stage raised the process
+    high-water mark, otherwise the larger of the RSS at its start and end.
+    `process_peak_rss` is the process's lifetime peak at the end of the stage.
+    """
+
+    def __init__(
+        self,
+        profile: bool | str | Iterable[str] = False,
+        hooks: Iterable[Callable[[dict[str, Any]], None]] = (),
+        profile_limit: int = 30,
+    ):
+        if isinstance(profile, bool):
+            self.profile = profile
+        elif isinstance(profile, str):
+            self.profile = {profile}
+        else:
+            self.profile = set(profile)
+        self.hooks = list(hooks)
+        self.profile_limit = profile_limit
+        self.stages: list[dict[str, Any]] = []
+
+    def should_profile(self, name: str) -> bool:
+        if isinstance(self.profile, bool):
+            return self.profile
+        return name in self.profile
+
+    @contextmanager
+    def stage(self, name: str, path: str | None = None):
+        record = {"stage": name, "path": path, "counts": {}}
+        profiler = cProfile.Profile() if self.should_profile(name) else None
+
+        rss_start, process_peak_start = current_rss(), process_peak_rss()
+        wall_start, cpu_start = perf_counter(), process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record["counts"]
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record["wall_time"] = perf_counter() - wall_start
+            record["cpu_time"] = process_time() - cpu_start
+            record["process_peak_rss"] = process_peak_rss()
+            record["peak_rss"] = stage_peak_rss(
+                rss_start, current_rss(), process_peak_start, record["process_peak_rss"]
+            )
+            if profiler is not None:
+                output = io.StringIO()
+                stats = pstats.Stats(profiler, stream=output)
+                stats.sort_stats("cumulative").print_stats(self.profile_limit)
+                record["profile"] = output.getvalue()
+            self.stages.append(record)
+            for hook in self.hooks:
+                hook(record)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "stages": self.stages,
+            "total": {
+                "wall_time": sum(stage["wall_time"] for stage in self.stages),
+                "cpu_time": sum(stage["cpu_time"] for stage in self.stages),
+                "process_peak_rss": process_peak_rss(),
+            },
+        }
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.report(), indent=4, ensure_ascii=False).encode("utf-8")
+
+    def write(self, path: str):
+        Path(path).write_bytes(self.to_json())
@@ -0,0 +1,107 @@
+import csv
+import json
+
+from pathlib import Path
+from typing import Any
+from loguru import logger
+
+
+REASONS = {
+    "missing": ("WARNING", "links have item IDs that don't exist"),
+    "unmatched": ("WARNING", "links did not have a good match"),
+    "missing_source": ("WARNING", "links have a source item that doesn't exist"),
+    "missing_target": ("ERROR", "links have a target item that doesn't exist"),
+}
+
+
+class MergeReport:
+    """
+    Aggregates links skipped while loading and merging into a CitationGraph.
+
+    Only counts and the first `sample_size` links per reason are kept in memory
+    and logged. If `dump_path` is given (`.csv` or `.jsonl`), every skipped link
+    is also written there in batches of `buffer_size`.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 10,
+        dump_path: str | None = None,
+        buffer_size: int = 10_000,
+    ):
+        self.sample_size = sample_size
+        self.dump_path = Path(dump_path) if dump_path is not None else None
+        self.buffer_size = buffer_size
+        self.sections: list[dict[str, Any]] = []
+        self.buffer: list[tuple[str, str, str, str]] = []
+
+        if self.dump_path is not None:
+            if self.dump_path.suffix not in (".csv", ".jsonl"):
+                raise ValueError(
+                    f"Unsupported dump format '{self.dump_path.suffix}'. Please use a '.csv' or '.jsonl' path."
+                )
+            with open(self.dump_path, "w", newline="", encoding="utf-8") as f:
+                if self.dump_path.suffix == ".csv":
+                    csv.writer(f).writerow(["origin", "reason", "source", "target"])
+
+    def begin(self, origin: str):
+        self.flush()
+        self.sections.append({"origin": origin, "counts": {}, "samples": {}})
+
+    def add(self, reason: str, source: str, target: str):
+        section = self.sections[-1]
+        section["counts"][reason] = section["counts"].get(reason, 0) + 1
+        samples = section["samples"].setdefault(reason, [])
+        if len(samples) < self.sample_size:
+            samples.append((source, target))
+        if self.dump_path is not None:
+            self.buffer.append((section["origin"], reason, source, target))
+            if len(self.buffer) >= self.buffer_size:
+                self.flush()
+
+    def flush(self):
+        if self.dump_path is None or len(self.buffer) == 0:
+            return
+        with open(self.dump_path, "a", newline="", encoding="utf-8") as f:
+            if self.dump_path.suffix == ".csv":
+                csv.writer(f).writerows(self.buffer)
+            else:
+                f.write(
+                    "".join(
+                        json.dumps(
+                            {"origin": origin, "reason": reason, "source": source, "target": target},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                        for origin, reason, source, target in self.buffer
+                    )
+                )
+        self.buffer = []
+
+    def log(self):
+        self.flush()
+        section = self.sections[-1]
+        for reason, count in section["counts"].items():
+            level, message = REASONS[reason]
+            lines = [f"{count} {message} and have been skipped:"]
+            lines += [f"  - {source} -> {target}" for source, target in section["samples"][reason]]
+            if count > len(section["samples"][reason]):
+                lines.append(f"  ... and {count - len(section['samples'][reason])} more.")
+            logger.log(level, "\n".join(lines))
+        if len(section["counts"]) > 0 and self.dump_path is not None:
+            logger.info(f"All skipped links have been written to '{self.dump_path}'.")
+
+    def totals(self) -> dict[str, int]:
+        totals = {}
+        for section in self.sections:
+            for reason, count in section["counts"].items():
+                totals[reason] = totals.get(reason, 0) + count
+        return totals
+
+    def to_dict(self) -> dict[str, Any]:
+        self.flush()
+        return {
+            "totals": self.totals(),
+            "sections": self.sections,
+            "dump_path": str(self.dump_path) if self.dump_path is not None else None,
+        }
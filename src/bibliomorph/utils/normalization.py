@@ -0,0 +1,87 @@
+import unicodedata
+
+from functools import lru_cache
+from re import compile
+from typing import Any, Callable, Iterable
+
+from cleantext import clean
+
+from .formatting import venue_abbreviation
+
+control_characters = compile(r"[\u0000-\u0008\u000b\u000c\u000e-\u001f\u007f-\u009f\u200b-\u200f\ufeff]")
+punctuation = compile(r"[^\w\s]")
+years = compile(r"\b(1[89]|20)\d\d[a-z]?\b|\s*'\d\d\b")
+whitespace = compile(r"\s+")
+
+
+def normalize_unicode(value: str) -> str:
+    return control_characters.sub("", unicodedata.normalize("NFKC", value))
+
+
+def strip_punctuation(value: str) -> str:
+    return punctuation.sub(" ", value)
+
+
+def remove_years(value: str) -> str:
+    return years.sub("", value)
+
+
+def collapse_whitespace(value: str) -> str:
+    return whitespace.sub(" ", value).strip()
+
+
+STEPS: dict[str, Callable[[str], str | None]] = {
+    "clean": clean,
+    "unicode": normalize_unicode,
+    "lowercase": str.casefold,
+    "punctuation": strip_punctuation,
+    "years": remove_years,
+    "whitespace": collapse_whitespace,
+    "abbreviation": venue_abbreviation,
+}
+
+
+class Normalizer:
+    """
+    A pipeline of string normalization steps with a bounded memo cache.
+
+    `steps` are names from `STEPS` or callables taking and returning a string.
+    A step returning None stops the pipeline. Share one instance between
+    loaders, matchers and formatters so each distinct string is normalized once.
+    Instances can be used directly as `MappingJSONFormatter.postprocess` entries.
+    """
+
+    def __init__(
+        self,
+        steps: Iterable[str | Callable[[str], str | None]] = (
+            "unicode",
+            "lowercase",
+            "punctuation",
+            "whitespace",
+        ),
+        cache_size: int | None = 100_000,
+    ):
+        self.steps = [STEPS[step] if isinstance(step, str) else step for step in steps]
+        self.cached = lru_cache(maxsize=cache_size)(self.apply)
+
+    def apply(self, value: str) -> str | None:
+        for step in self.steps:
+            value = step(value)
+            if value is None:
+                return None
+        return value
+
+    def normalize(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return self.cached(value if type(value) is str else str(value))
+
+    def normalize_batch(self, values: Iterable[Any]) -> list[str | None]:
+        normalize = self.normalize
+        return [normalize(value) for value in values]
+
+    def __call__(self, value: Any, item: Any = None) -> str | None:
+        return self.normalize(value)
+
+    def cache_info(self):
+        return self.cached.cache_info()
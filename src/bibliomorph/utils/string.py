@@ -1,37 +1,141 @@
-from typing import Iterable, Mapping
-import numpy as np
-from rapidfuzz import fuzz
-from scipy.optimize import linear_sum_assignment
+from collections import Counter
+from typing import Iterable
 
 
 def count_strings(strings: Iterable[str]):
-    counts = {}
-    for string in strings:
-        if string not in counts:
-            counts[string] = 0
-        counts[string] += 1
-    return sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    return Counter(strings).most_common()
+
+
+def _suffix_automaton(string: str):
+    # Each state stores its outgoing transitions, suffix link, length of the
+    # longest substring it represents, and the end position of its first occurrence.
+    transitions = [{}]
+    link = [-1]
+    length = [0]
+    first_end = [-1]
+    last = 0
+    for position, char in enumerate(string):
+        current = len(length)
+        transitions.append({})
+        link.append(0)
+        length.append(length[last] + 1)
+        first_end.append(position)
+
+        state = last
+        while state != -1 and char not in transitions[state]:
+            transitions[state][char] = current
+            state = link[state]
+        if state != -1:
+            target = transitions[state][char]
+            if length[state] + 1 == length[target]:
+                link[current] = target
+            else:
+                clone = len(length)
+                transitions.append(dict(transitions[target]))
+                link.append(link[target])
+                length.append(length[state] + 1)
+                first_end.append(first_end[target])
+                while state != -1 and transitions[state].get(char) == target:
+                    transitions[state][char] = clone
+                    state = link[state]
+                link[target] = clone
+                link[current] = clone
+        last = current
+    return transitions, link, length, first_end
+
+
+def _match_lengths(automaton, string: str) -> dict[int, int]:
+    # Longest match of `string` ending in each state it reaches. Only visited
+    # states and their suffix links are touched, not the whole automaton.
+    transitions, link, length, _ = automaton
+    matched = {}
+    state, current = 0, 0
+    for char in string:
+        while state != 0 and char not in transitions[state]:
+            state = link[state]
+            current = length[state]
+        if char in transitions[state]:
+            state = transitions[state][char]
+            current += 1
+            if current > matched.get(state, 0):
+                matched[state] = current
+    # A match ending in a state fully covers its suffix links
+    for state in list(matched):
+        parent = link[state]
+        while parent > 0 and matched.get(parent, 0) < length[parent]:
+            matched[parent] = length[parent]
+            parent = link[parent]
+    return matched
 
 
 def longest_common_string(strings: Iterable[str]):
+    # Duplicates don't change the result, so only walk each distinct string once
+    strings = list(dict.fromkeys(strings))
     shortest = min(strings, key=len)
-    left, right = 0, len(shortest)
+    others = [string for string in strings if string is not shortest]
+    if len(others) == 0:
+        return shortest
 
-    def is_common(substr):
-        return all(substr in s for s in strings)
+    # Substrings of the shortest string shared with one other string, as
+    # (start, end) intervals, found in linear time with a suffix automaton
+    automaton = _suffix_automaton(shortest)
+    first_end = automaton[3]
+    intervals = sorted(
+        (first_end[state] + 1 - size, first_end[state] + 1)
+        for state, size in _match_lengths(automaton, others[0]).items()
+    )
+    maximal = []
+    for start, end in intervals:
+        if len(maximal) == 0 or end > maximal[-1][1]:
+            maximal.append((start, end))
+    if len(maximal) == 0:
+        return ""
 
-    best = ""
+    # Any common substring lies within one of these intervals, so the rest of
+    # the strings only need to be checked against those candidates
+    remaining = others[1:]
+
+    def first_common(size: int) -> int | None:
+        positions = sorted(
+            {
+                position
+                for start, end in maximal
+                if end - start >= size
+                for position in range(start, end - size + 1)
+            }
+        )
+        checked = set()
+        for position in positions:
+            candidate = shortest[position : position + size]
+            if candidate in checked:
+                continue
+            checked.add(candidate)
+            if all(candidate in string for string in remaining):
+                return position
+        return None
+
+    best, best_start = 0, 0
+    left, right = 1, max(end - start for start, end in maximal)
     while left <= right:
-        mid = (left + right) // 2
-        found = None
-        for i in range(len(shortest) - mid + 1):
-            candidate = shortest[i : i + mid]
-            if is_common(candidate):
-                found = candidate
-                break
-        if found:
-            best = found
-            left = mid + 1
+        middle = (left + right) // 2
+        position = first_common(middle)
+        if position is not None:
+            best, best_start = middle, position
+            left = middle + 1
         else:
-            right = mid - 1
-    return best
+            right = middle - 1
+    return shortest[best_start : best_start + best]
+
+
+def summarize_strings(groups: Iterable[Iterable[str]]):
+    """
+    For each group of strings, return its `count_strings` result together with
+    its `longest_common_string`. Each group is counted once, and the common
+    string is computed from the distinct strings only.
+    """
+    summaries = []
+    for strings in groups:
+        counts = Counter(strings)
+        common = longest_common_string(counts) if len(counts) > 0 else ""
+        summaries.append((counts.most_common(), common))
+    return summaries
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from bibliomorph.utils.string import (
+    count_strings,
+    longest_common_string,
+    summarize_strings,
+)
+
+
+def brute_force_longest_common_string(strings):
+    shortest = min(strings, key=len)
+    for size in range(len(shortest), 0, -1):
+        for start in range(len(shortest) - size + 1):
+            candidate = shortest[start : start + size]
+            if all(candidate in string for string in strings):
+                return candidate
+    return ""
+
+
+class LongestCommonStringTest(unittest.TestCase):
+
+    def test_examples(self):
+        self.assertEqual(longest_common_string(["ab", "cb"]), "b")
+        self.assertEqual(longest_common_string(["ddbaecae bb", "bcca", "bbbe ace "]), "b")
+        self.assertEqual(longest_common_string(["abc"]), "abc")
+        self.assertEqual(longest_common_string(["abc", "xyz"]), "")
+        self.assertEqual(longest_common_string(["", "abc"]), "")
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for case in range(5000):
+            alphabet = "ab" if case % 2 else "abcde "
+            strings = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 15)))
+                for _ in range(rng.randint(1, 5))
+            ]
+            with self.subTest(strings=strings):
+                self.assertEqual(
+                    longest_common_string(strings),
+                    brute_force_longest_common_string(strings),
+                )
+
+
+class SummarizeStringsTest(unittest.TestCase):
+
+    def test_matches_single_group_functions(self):
+        groups = [["a title. In CHI", "the title. In CHI", "a title. In CHI"], [], ["x"]]
+        self.assertEqual(
+            summarize_strings(groups),
+            [
+                (count_strings(group), longest_common_string(group) if group else "")
+                for group in groups
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()